@@ -9,13 +9,14 @@ based on manually selected events and auto-selection preferences.
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
 from src.ics_writer import write_combined_ics
-from src.util import slugify, json_default
+from src.util import slugify, json_default, parse_datetime
 
 
 def _load_curated_config(config_path: str) -> List[Dict[str, Any]]:
@@ -68,8 +69,7 @@ def _is_future_event(event: Dict[str, Any], now: Optional[datetime] = None) -> b
         if isinstance(start_str, datetime):
             start_dt = start_str
         else:
-            from dateutil import parser as dtparse
-            start_dt = dtparse.parse(str(start_str))
+            start_dt = parse_datetime(str(start_str))
         
         if start_dt.tzinfo is None:
             start_dt = start_dt.replace(tzinfo=timezone.utc)
@@ -128,8 +128,7 @@ def _event_matches_preferences(
         try:
             start_str = event.get("start_utc")
             if start_str:
-                from dateutil import parser as dtparse
-                start_dt = dtparse.parse(str(start_str)) if isinstance(start_str, str) else start_str
+                start_dt = parse_datetime(str(start_str)) if isinstance(start_str, str) else start_str
                 if start_dt.tzinfo is None:
                     start_dt = start_dt.replace(tzinfo=timezone.utc)
                 else:
@@ -189,6 +188,10 @@ def _event_matches_preferences(
     return True
 
 
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
 def _normalize_for_duplicate_check(title: str, start_utc: str) -> str:
     """
     Create a normalized key for duplicate detection based on title and date.
@@ -200,17 +203,14 @@ def _normalize_for_duplicate_check(title: str, start_utc: str) -> str:
     Returns:
         Normalized key for comparison
     """
-    import re
-    from dateutil import parser as dtparse
-    
     # Normalize title: lowercase, remove special chars, collapse whitespace
-    normalized_title = re.sub(r'[^\w\s]', '', title.lower())
-    normalized_title = re.sub(r'\s+', ' ', normalized_title).strip()
+    normalized_title = _NON_WORD_RE.sub('', title.lower())
+    normalized_title = _WS_RE.sub(' ', normalized_title).strip()
     
     # Normalize date to just the date part (ignore time)
     try:
         if isinstance(start_utc, str):
-            dt = dtparse.parse(start_utc)
+            dt = parse_datetime(start_utc)
         else:
             dt = start_utc
         date_key = dt.strftime("%Y-%m-%d") if dt else ""
@@ -1,8 +1,13 @@
 # src/fetch.py
 from __future__ import annotations
+import json
+import os
+import threading
 import time
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 _UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -10,6 +15,26 @@ _UA = (
     "Chrome/126.0 Safari/537.36"
 )
 
+# (connect, read): fail fast on dead hosts, stay patient with slow WordPress pages.
+DEFAULT_TIMEOUT = (5, 30)
+
+# Where conditional-GET validators persist between runs ("" disables).
+CACHE_DIR = os.getenv("NW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "northwoods"))
+
+# Detail pages bigger than this are not worth parsing (media, runaway pages).
+MAX_HTML_BYTES = int(os.getenv("NW_MAX_HTML_BYTES", str(5 * 1024 * 1024)))
+
+def is_html_response(resp: requests.Response) -> bool:
+    """
+    False when a body should not reach an HTML parser: a declared non-HTML
+    Content-Type (PDF, image, feed) or more than MAX_HTML_BYTES of content.
+    A missing Content-Type is given the benefit of the doubt.
+    """
+    ctype = resp.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    if ctype and ctype not in ("text/html", "application/xhtml+xml"):
+        return False
+    return len(resp.content) <= MAX_HTML_BYTES
+
 def session(timeout: int = 30) -> requests.Session:
     s = requests.Session()
     s.headers.update({
@@ -21,8 +46,41 @@ def session(timeout: int = 30) -> requests.Session:
     s.timeout = timeout  # type: ignore[attr-defined]
     return s
 
+_SHARED: Optional[requests.Session] = None
+_SHARED_LOCK = threading.Lock()
+
+def shared_session() -> requests.Session:
+    """
+    Process-wide session with a larger connection pool, so sources that sit on
+    the same host/CDN reuse keep-alive connections. Callers must not close it.
+    """
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            s = session()
+            s.timeout = DEFAULT_TIMEOUT  # type: ignore[attr-defined]
+            retry = Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                # A 429/503 Retry-After can ask for minutes; back off on our own
+                # short schedule instead of parking a worker thread that long.
+                respect_retry_after_header=False,
+                raise_on_status=False,  # hand back the last response; callers check .ok
+            )
+            # pool_block=False: a worker that finds the pool busy opens an extra
+            # connection rather than waiting for one to free up.
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, pool_block=False, max_retries=retry)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _SHARED = s
+    return _SHARED
+
 def get(url: str, s: Optional[requests.Session] = None, retries: int = 2) -> requests.Response:
-    s = s or session()
+    if s is None:
+        # The shared adapter already retries with backoff; don't multiply it.
+        s, retries = shared_session(), 0
     last_exc = None
     for i in range(retries + 1):
         try:
@@ -35,3 +93,158 @@ def get(url: str, s: Optional[requests.Session] = None, retries: int = 2) -> req
                 time.sleep(0.7 * (i + 1))
                 continue
             raise last_exc
+
+class JsonCache:
+    """
+    Small string-keyed store persisted as one JSON file under CACHE_DIR, for
+    facts worth remembering between runs. Safe to update from worker threads.
+    """
+
+    def __init__(self, name: str, root: Optional[str] = None):
+        root = CACHE_DIR if root is None else root
+        self.path = os.path.join(root, f"{name}.json") if root else None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data: Dict[str, Any] = {}
+        if self.path:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._data = data
+            except Exception:
+                pass
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            if self._data.get(key) != value:
+                self._data[key] = value
+                self._dirty = True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._dirty = True
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return self._data
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = f"{self.path}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._snapshot(), f)
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except Exception:
+                pass
+
+class ValidatorCache(JsonCache):
+    """
+    Per-URL ETag/Last-Modified validators plus whatever the caller parsed
+    from that response.
+
+    Send validators() with the next GET; on 304 reuse payload(url) instead
+    of re-downloading and re-parsing the page.
+
+    Entries written under another version are misses, so bump version when
+    the parse behind the payloads changes. save() only writes entries read
+    or written by this process; pages no longer linked drop out. Share one
+    instance per name across a run (module level) so sources that use the
+    same cache do not prune each other's entries.
+    """
+
+    def __init__(self, name: str, version: int = 1, root: Optional[str] = None):
+        super().__init__(name, root)
+        self.version = version
+        self._touched: set = set()
+        # Untouched entries loaded from disk still need writing out (pruned).
+        self._dirty = bool(self._data)
+
+    def _entry(self, url: str) -> Dict[str, Any]:
+        with self._lock:
+            if url not in self._touched:
+                self._touched.add(url)
+                # an earlier save() in this run may have left it out
+                self._dirty = self._dirty or url in self._data
+        entry = self.get(url)
+        return entry if isinstance(entry, dict) and entry.get("v") == self.version else {}
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {k: v for k, v in self._data.items() if k in self._touched}
+
+    def validators(self, url: str) -> Dict[str, str]:
+        entry = self._entry(url)
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def payload(self, url: str) -> Any:
+        return self._entry(url).get("payload")
+
+    def put(self, url: str, resp: requests.Response, payload: Any) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # Nothing to revalidate with next time.
+            self.discard(url)
+            return
+        with self._lock:
+            self._touched.add(url)
+        self.set(url, {"v": self.version, "etag": etag, "last_modified": last_modified, "payload": payload})
+
+def get_cached(
+    s: requests.Session,
+    url: str,
+    cache: Optional[ValidatorCache],
+    timeout: Any = DEFAULT_TIMEOUT,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[requests.Response], Any]:
+    """
+    Conditional GET. Returns (None, payload) when the server answers 304 and a
+    payload is cached, else (response, None) -- raise_for_status() already run.
+    """
+    conditional = dict(headers or {})
+    if cache:
+        conditional.update(cache.validators(url))
+    resp = s.get(url, timeout=timeout, headers=conditional or None)
+    if resp.status_code == 304 and cache:
+        payload = cache.payload(url)
+        if payload is not None:
+            return None, payload
+        resp = s.get(url, timeout=timeout, headers=headers)
+    resp.raise_for_status()
+    return resp, None
+
+def get_parsed(
+    s: requests.Session,
+    url: str,
+    cache: Optional[ValidatorCache],
+    parse: Callable[[requests.Response], Any],
+    default: Any = None,
+    timeout: Any = DEFAULT_TIMEOUT,
+    headers: Optional[Dict[str, str]] = None,
+) -> Any:
+    """
+    Conditional GET of a detail page, returning parse(resp). A 304 hands back
+    last run's parse without a body; a non-HTML or oversized response yields
+    default unparsed. Whatever is returned is what gets cached, so parse and
+    default must produce JSON-serialisable values.
+    """
+    resp, cached = get_cached(s, url, cache, timeout=timeout, headers=headers)
+    if resp is None:
+        return cached
+    value = parse(resp) if is_html_response(resp) else default
+    if cache:
+        cache.put(url, resp, value)
+    return value
@@ -21,10 +21,9 @@ import os
 from datetime import timedelta, timezone
 from typing import Dict, Iterable, List, Tuple
 
-from dateutil import parser as dtparse
 from icalendar import Calendar, Event
 
-from src.util import slugify
+from src.util import parse_datetime, slugify, stable_uid
 
 
 # -------------------------
@@ -38,7 +37,7 @@ def _parse_dt(s: str | None):
     if not s:
         return None
     try:
-        dt = dtparse.parse(s)
+        dt = parse_datetime(s)
         # Treat naive as UTC
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=UTC)
@@ -64,7 +63,7 @@ def _events_to_calendar(events: Iterable[dict], cal_name: str = "Northwoods Even
         title = (ev.get("title") or "Untitled").strip()
         url = ev.get("url")
         location = (ev.get("location") or "").strip() or None
-        uid = ev.get("uid") or f"{abs(hash(url or title)) % 10**10}@northwoods-v2"
+        uid = ev.get("uid") or stable_uid("", url or title) + "@northwoods-v2"
 
         start_dt = _parse_dt(ev.get("start_utc"))
         end_dt = _parse_dt(ev.get("end_utc"))
@@ -9,10 +9,12 @@ from datetime import date, datetime, time, timedelta, timezone
 from dateutil import parser as dtparse
 from importlib import import_module
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
 import yaml
 
 # shared helpers
+from src.fetch import JsonCache
 from src.ics_writer import write_combined_ics, write_per_source_ics
 from src.util import slugify, json_default, expand_tec_ics_urls
 from src.curated import process_curated_feeds
@@ -39,6 +41,23 @@ COMBINED_ICS_PATH = os.getenv("NW_COMBINED_ICS", os.path.join("public", "combine
 SOURCES_YAML = os.getenv("NW_SOURCES_YAML", "config/sources.yaml")
 EVENTS_PREVIEW_LIMIT = int(os.getenv("NW_EVENTS_PREVIEW_LIMIT", "0"))
 
+# host -> epoch seconds until which the TEC REST API is assumed unavailable;
+# persisted under NW_CACHE_DIR, so it only carries over where that directory
+# survives between runs. Consulted only for sources that have a fallback.
+_REST_UNAVAILABLE = JsonCache("tec_rest_unavailable")
+REST_UNAVAILABLE_TTL = 3600
+
+
+def _rest_known_unavailable(host: str) -> bool:
+    until = _REST_UNAVAILABLE.get(host)
+    return isinstance(until, (int, float)) and until > datetime.now(timezone.utc).timestamp()
+
+
+def _mark_rest_unavailable(host: str) -> None:
+    _REST_UNAVAILABLE.set(host, datetime.now(timezone.utc).timestamp() + REST_UNAVAILABLE_TTL)
+    _REST_UNAVAILABLE.save()
+
+
 def _window() -> tuple[datetime, datetime]:
     now = datetime.now(timezone.utc)
     return now - timedelta(days=1), now + timedelta(days=DEFAULT_WINDOW_FWD)
@@ -143,20 +162,33 @@ def _fetch_one(source: Dict[str, Any], start_date: datetime, end_date: datetime)
         meta: Dict[str, Any] = {}
         tec_err: Optional[Exception] = None
         events: List[Dict[str, Any]] = []
-        prefer_fallback = bool(source.get("prefer_fallback") or source.get("fallback_only"))
-
-        if not prefer_fallback:
+        prefer_fallback = bool(source.get("prefer_fallback") or source.get("fallback_only")
+                               or source.get("force_html"))
+        fallback_ics = source.get("fallback_ics") or source.get("ics_url")
+        allow_html_fallback = bool(source.get("allow_html_fallback") or prefer_fallback)
+        # The unavailable verdict may only short-circuit REST when something else
+        # will run in its place; otherwise the source would go quietly empty.
+        has_fallback = bool(fallback_ics and _fetch_ics_raw is not None) or allow_html_fallback
+        host = urlsplit(url).netloc.lower()
+        rest_skipped = False
+
+        if not prefer_fallback and has_fallback and _rest_known_unavailable(host):
+            rest_skipped = True
+            meta.setdefault("notes", []).append(f"tec_rest skipped: no REST events from {host} recently")
+        elif not prefer_fallback:
             try:
                 events = fetch_tec_rest(url, _ymd(start_date), _ymd(end_date)) or []
                 if events:
                     _set_meta(source, meta)
                     return events
+                _mark_rest_unavailable(host)
             except Exception as exc:
                 tec_err = exc
+                # Timeouts and 5xx are transient; only a missing endpoint is a verdict.
+                if getattr(getattr(exc, "response", None), "status_code", None) in (404, 410):
+                    _mark_rest_unavailable(host)
                 meta.setdefault("warnings", []).append(f"tec_rest request failed: {exc}")
 
-        fallback_ics = source.get("fallback_ics") or source.get("ics_url")
-        allow_html_fallback = bool(source.get("allow_html_fallback") or prefer_fallback)
         if fallback_ics and _fetch_ics_raw is not None:
             ics_attempt_warnings: List[str] = []
             for candidate in expand_tec_ics_urls(str(fallback_ics), start_date, end_date):
@@ -202,6 +234,10 @@ def _fetch_one(source: Dict[str, Any], start_date: datetime, end_date: datetime)
         if prefer_fallback and fallback_ics and _fetch_ics_raw is None:
             meta.setdefault("warnings", []).append("ics fallback requested but parser unavailable")
 
+        if rest_skipped:
+            meta.setdefault("warnings", []).append(
+                f"tec_rest skipped for {host} and no fallback returned events")
+
         if tec_err:
             _set_meta(source, meta)
             raise tec_err
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from dateutil import parser as dtp
 import hashlib
 from typing import Optional, Dict, Any
 
+from src.util import parse_datetime
+
 
 def _to_dt_utc(x) -> Optional[datetime]:
     if x is None:
@@ -16,7 +17,7 @@ def _to_dt_utc(x) -> Optional[datetime]:
         return x.astimezone(timezone.utc)
     # assume string
     try:
-        dt = dtp.parse(str(x))
+        dt = parse_datetime(str(x))
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
@@ -1,20 +1,25 @@
 # src/parsers/growthzone_html.py
 from __future__ import annotations
 import json, re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from html import unescape
-from typing import Any, Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse, parse_qs, unquote
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse, parse_qs, unquote
+
+from src.fetch import DEFAULT_TIMEOUT, ValidatorCache, get_parsed, shared_session
+from src.util import JSONLD_SCRIPT_RE, absurl, canonical_link, json_loads, jsonld_may_have_event, strip_markup
+
+# Patterns are compiled once here; the detail parsers run them on every page.
+_TRAILING_WS_RE = re.compile(r"[ \t]+\n")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 def _clean_text(s: Optional[str]) -> Optional[str]:
     if not s: return None
-    body = re.sub(r"(?is)<script[^>]*>.*?</script>|<style[^>]*>.*?</style>", "", s)
-    body = re.sub(r"(?is)<br\s*/?>", "\n", body)
-    body = re.sub(r"(?is)</p\s*>", "\n", body)
-    body = re.sub(r"(?is)<[^>]+>", "", body)
-    body = unescape(body).strip()
-    body = re.sub(r"[ \t]+\n", "\n", body)
-    body = re.sub(r"\n{3,}", "\n\n", body)
+    body = unescape(strip_markup(s)).strip()
+    body = _TRAILING_WS_RE.sub("\n", body)
+    body = _BLANK_LINES_RE.sub("\n\n", body)
     return body or None
 
 def _coerce_signature(args, kwargs):
@@ -54,16 +59,17 @@ _GZ_DETAIL_RE = re.compile(
     re.I,
 )
 
+_ABS_HTTP_RE = re.compile(r'https?://', re.I)
+
 def _extract_gz_detail_links(page_html: str, page_base: str) -> Set[str]:
-    out: Set[str] = set()
-    for m in _GZ_DETAIL_RE.finditer(page_html):
-        href = m.group(1)
-        if href.lower().startswith(("mailto:", "tel:")): continue
-        if not re.match(r'^https?://', href, re.I):
-            if not href.startswith("/"): href = "/" + href
-            href = urljoin(page_base, href)
-        out.add(href)
-    return out
+    is_abs, join = _ABS_HTTP_RE.match, absurl
+    # Canonicalise before the set dedups, so #fragment/utm_* variants of one
+    # page collapse into a single detail fetch.
+    return {
+        canonical_link(href if is_abs(href) else join(page_base, href if href.startswith("/") else "/" + href))
+        for href in (m.group(1) for m in _GZ_DETAIL_RE.finditer(page_html))
+        if not href.lower().startswith(("mailto:", "tel:"))
+    }
 
 # ---- St. Germain helpers (outbound to WP) ----
 _STG_OUTBOUND_DIRECT = re.compile(
@@ -80,18 +86,18 @@ def _multi_unquote(u: str, times: int = 3) -> str:
         v = v2
     return v
 
+_STG_EVENT_URL_RE = re.compile(r"^https?://(?:www\.)?st-germain\.com/(?:event|events)/", re.I)
+
 def _extract_outbound_stgermain(page_html: str, page_base: str) -> Set[str]:
-    out: Set[str] = set()
-    for m in _STG_OUTBOUND_DIRECT.finditer(page_html):
-        out.add(m.group(1))
+    out: Set[str] = {canonical_link(m.group(1)) for m in _STG_OUTBOUND_DIRECT.finditer(page_html)}
     for m in _STG_LINKCLICK.finditer(page_html):
-        u = urljoin(page_base, m.group(1))
+        u = absurl(page_base, m.group(1))
         qs = parse_qs(urlparse(u).query)
         raw = (qs.get("link") or qs.get("Link") or [None])[0]
         if raw:
             tgt = _multi_unquote(raw)
-            if re.search(r"^https?://(?:www\.)?st-germain\.com/(?:event|events)/", tgt, re.I):
-                out.add(tgt)
+            if _STG_EVENT_URL_RE.search(tgt):
+                out.add(canonical_link(tgt))
     return out
 
 def _events_root_same_host(u: str) -> str:
@@ -114,37 +120,39 @@ def _month_starts(n: int = 6) -> List[str]:
     return out
 
 # ---- JSON-LD ----
-def _jsonld_events(html: str) -> List[Dict[str, Any]]:
-    evs: List[Dict[str, Any]] = []
-    for sm in re.finditer(
-        r'(?is)<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', html
-    ):
+def _is_event_node(node: Dict[str, Any]) -> bool:
+    t = node.get("@type")
+    if isinstance(t, list):
+        return any(str(x).lower() == "event" for x in t)
+    return str(t).lower() == "event"
+
+def _iter_jsonld_events(html: str) -> Iterator[Dict[str, Any]]:
+    """Lazily yield Event nodes in page order; later blocks are only decoded if asked for."""
+    for sm in JSONLD_SCRIPT_RE.finditer(html):
         block = sm.group(1).strip()
+        if not jsonld_may_have_event(block):
+            continue
         try:
-            data = json.loads(block)
+            data = json_loads(block)
         except Exception:
             continue
-        def _maybe(node):
-            t = node.get("@type")
-            ok = False
-            if isinstance(t, list):
-                ok = any(str(x).lower() == "event" for x in t)
-            else:
-                ok = str(t).lower() == "event"
-            if ok: evs.append(node)
-        if isinstance(data, dict):
-            if "@type" in data: _maybe(data)
-            g = data.get("@graph")
+        # Explicit stack instead of recursion; reversed pushes keep page order.
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict): continue
+            if _is_event_node(node): yield node
+            g = node.get("@graph")
             if isinstance(g, list):
-                for n in g:
-                    if isinstance(n, dict): _maybe(n)
-        elif isinstance(data, list):
-            for n in data:
-                if isinstance(n, dict): _maybe(n)
-    return evs
+                stack.extend(reversed(g))
+
+_H1_RE = re.compile(r"(?is)<h1[^>]*>(.*?)</h1>")
 
 def _page_h1(html: str) -> Optional[str]:
-    m = re.search(r"(?is)<h1[^>]*>(.*?)</h1>", html)
+    m = _H1_RE.search(html)
     return _clean_text(m.group(1)) if m else None
 
 # ---- St. Germain WP detail parsing ----
@@ -159,8 +167,24 @@ def _parse_month(mtxt: str) -> Optional[int]:
     a = mtxt[:3].lower()
     return _ABBR.get(a)
 
+_TIME_TOKEN_RE = re.compile(r'(?i)^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$')
+_STG_LOC_SPAN_RE = re.compile(r'(?is)<span[^>]*class="[^"]*x-text-content-text-primary[^"]*"[^>]*>(.*?)</span>')
+_STG_LOC_TEXT_RE = re.compile(r'(?i)\b(St\.?\s*Germain[^<\n]{0,120})')
+_DATE_RANGE_TWO_MONTHS_RE = re.compile(
+    r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})\s*(?:–|-|to)\s*'
+    r'([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})')
+_DATE_RANGE_ONE_MONTH_RE = re.compile(
+    r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*(?:–|-|&|to)\s*(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})')
+_DATE_SINGLE_RE = re.compile(r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})')
+_TIME_RANGE_RE = re.compile(
+    r'(?i)\b(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))\s*(?:–|-|to|&)\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))')
+_TIME_OPT_RANGE_RE = re.compile(
+    r'(?i)\b(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))(?:\s*(?:–|-|to|&)\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm)))?')
+_TIME_SEP_RE = re.compile(r'(?i)(?:–|-|to|&)')
+_EVENT_INFO_RE = re.compile(r'(?is)(<h2[^>]*>\s*Event\s*Info\s*</h2>.*?)(?:<h2|\Z)')
+
 def _parse_time_token(tstr: str) -> Tuple[int, int]:
-    m = re.match(r'(?i)^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*$', tstr.strip())
+    m = _TIME_TOKEN_RE.match(tstr.strip())
     if not m:
         return 9, 0
     hh = int(m.group(1)); mm = int(m.group(2) or 0); ap = (m.group(3) or "").lower()
@@ -169,55 +193,49 @@ def _parse_time_token(tstr: str) -> Tuple[int, int]:
     return hh, mm
 
 def _parse_stgermain_location(html: str) -> Optional[str]:
-    m = re.search(
-        r'(?is)<span[^>]*class="[^"]*x-text-content-text-primary[^"]*"[^>]*>(.*?)</span>',
-        html,
-    )
+    m = _STG_LOC_SPAN_RE.search(html)
     if m:
         return _clean_text(m.group(1))
-    m2 = re.search(r'(?i)\b(St\.?\s*Germain[^<\n]{0,120})', html)
+    m2 = _STG_LOC_TEXT_RE.search(html)
     return _clean_text(m2.group(1)) if m2 else None
 
 def _parse_stgermain_dates(blob: str) -> Tuple[Optional[str], Optional[str]]:
     txt = _clean_text(blob) or ""
     # Range with two months
-    m = re.search(
-        r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})\s*(?:–|-|to)\s*'
-        r'([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})', txt)
+    m = _DATE_RANGE_TWO_MONTHS_RE.search(txt)
     if m:
         m1,d1,y1,m2,d2,y2 = m.groups()
         M1=_parse_month(m1); M2=_parse_month(m2)
         if M1 and M2:
             start = datetime(int(y1), M1, int(d1)); end = datetime(int(y2), M2, int(d2))
-            t = re.search(r'(?i)\b(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))\s*(?:–|-|to|&)\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))', txt)
+            t = _TIME_RANGE_RE.search(txt)
             if t:
-                parts = re.split(r'(?i)(?:–|-|to|&)', t.group(0))
+                parts = _TIME_SEP_RE.split(t.group(0))
                 h1,m1_=_parse_time_token(parts[0]); h2,m2_=_parse_time_token(parts[-1])
                 start=start.replace(hour=h1,minute=m1_); end=end.replace(hour=h2,minute=m2_)
             return start.isoformat(), end.isoformat()
     # Month D – D, YYYY  (or &)
-    m = re.search(
-        r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*(?:–|-|&|to)\s*(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})', txt)
+    m = _DATE_RANGE_ONE_MONTH_RE.search(txt)
     if m:
         mon,d1,d2,y = m.groups()
         M=_parse_month(mon)
         if M:
             start=datetime(int(y),M,int(d1)); end=datetime(int(y),M,int(d2))
-            t = re.search(r'(?i)\b(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))\s*(?:–|-|to|&)\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))', txt)
+            t = _TIME_RANGE_RE.search(txt)
             if t:
-                parts = re.split(r'(?i)(?:–|-|to|&)', t.group(0))
+                parts = _TIME_SEP_RE.split(t.group(0))
                 h1,m1_=_parse_time_token(parts[0]); h2,m2_=_parse_time_token(parts[-1])
                 start=start.replace(hour=h1,minute=m1_); end=end.replace(hour=h2,minute=m2_)
             return start.isoformat(), end.isoformat()
     # Single date with optional time/range
-    m = re.search(r'(?i)\b([A-Z][a-z]{2,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})', txt)
+    m = _DATE_SINGLE_RE.search(txt)
     if m:
         mon,d,y = m.groups(); M=_parse_month(mon)
         if M:
             start = datetime(int(y),M,int(d))
-            t2 = re.search(r'(?i)\b(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))(?:\s*(?:–|-|to|&)\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm)))?', txt)
+            t2 = _TIME_OPT_RANGE_RE.search(txt)
             if t2:
-                parts = re.split(r'(?i)(?:–|-|to|&)', t2.group(0))
+                parts = _TIME_SEP_RE.split(t2.group(0))
                 h1,m1_=_parse_time_token(parts[0]); start=start.replace(hour=h1,minute=m1_)
                 if len(parts)==2:
                     h2,m2_=_parse_time_token(parts[1]); end=datetime(int(y),M,int(d),h2,m2_)
@@ -227,7 +245,7 @@ def _parse_stgermain_dates(blob: str) -> Tuple[Optional[str], Optional[str]]:
 
 def _parse_stgermain_detail(html: str, url: str, source: str) -> Optional[Dict[str, Any]]:
     title = _page_h1(html) or "(untitled)"
-    sect = re.search(r'(?is)(<h2[^>]*>\s*Event\s*Info\s*</h2>.*?)(?:<h2|\Z)', html)
+    sect = _EVENT_INFO_RE.search(html)
     blob = sect.group(1) if sect else html
     start_iso, end_iso = _parse_stgermain_dates(blob)
     location = _parse_stgermain_location(html)
@@ -243,25 +261,47 @@ def _parse_stgermain_detail(html: str, url: str, source: str) -> Optional[Dict[s
     }
 
 # ---- GrowthZone labeled fallback (fixes Rhinelander when no JSON-LD/microdata) ----
+_LOCATION_BLOCK_RE = re.compile(
+    r'(?is)^\s*Location\s*:\s*(.*?)\n(?=(?:Date/Time Information|Contact Information|Fees/Admission|Set a Reminder|Event Description)\s*:|$)')
+
+@lru_cache(maxsize=None)
+def _label_line_re(label: str) -> "re.Pattern[str]":
+    return re.compile(rf'(?im)^{re.escape(label)}\s*:\s*(.*)$')
+
 def _extract_label_lines(text: str, label: str) -> Optional[str]:
-    pat = re.compile(rf'(?im)^{re.escape(label)}\s*:\s*(.*)$')
-    m = pat.search(text)
+    m = _label_line_re(label).search(text)
     if m:
         return m.group(1).strip()
     if label.lower() == "location":
-        m2 = re.search(r'(?is)^\s*Location\s*:\s*(.*?)\n(?=(?:Date/Time Information|Contact Information|Fees/Admission|Set a Reminder|Event Description)\s*:|$)', text)
+        m2 = _LOCATION_BLOCK_RE.search(text)
         if m2:
             return m2.group(1).strip()
     return None
 
+# All three labels in one scan. The lookahead keeps matches zero-width so a
+# value that spills onto the next line can't hide the label on that line.
+_GZ_LABELS_RE = re.compile(r'(?im)^(date|time|location)(?=\s*:\s*(.*)$)')
+
+def _label_values(text: str) -> Dict[str, str]:
+    found: Dict[str, str] = {}
+    for m in _GZ_LABELS_RE.finditer(text):
+        found.setdefault(m.group(1).lower(), m.group(2).strip())
+    return found
+
+_GZ_DATE_RE = re.compile(r'(?i)\b([A-Z][a-z]{2,9})\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})')
+_GZ_TIME_RANGE_RE = re.compile(r'(?i)(\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*(?:–|-|to)\s*(\d{1,2}(?::\d{2})?\s*(?:am|pm))')
+_GZ_TIME_AMPM_RE = re.compile(r'(?i)^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*$')
+_GZ_TIME_RE = re.compile(r'(?i)(\d{1,2})(?::(\d{2}))?\s*(am|pm)')
+
 def _parse_gz_labeled(detail_html: str) -> Optional[Dict[str, Any]]:
     txt = _clean_text(detail_html) or ""
-    date_str = _extract_label_lines(txt, "Date")
-    time_str = _extract_label_lines(txt, "Time")
-    loc = _extract_label_lines(txt, "Location")
+    labels = _label_values(txt)
+    date_str = labels.get("date")
+    time_str = labels.get("time")
+    loc = labels["location"] if "location" in labels else _extract_label_lines(txt, "Location")
     if not date_str:
         return None
-    dm = re.search(r'(?i)\b([A-Z][a-z]{2,9})\s+(\d{1,2})(?:st|nd|rd|th)?\s*,\s*(\d{4})', date_str)
+    dm = _GZ_DATE_RE.search(date_str)
     if not dm:
         return None
     mon, d, y = dm.groups()
@@ -271,10 +311,10 @@ def _parse_gz_labeled(detail_html: str) -> Optional[Dict[str, Any]]:
     start = datetime(int(y), M, int(d))
     end = None
     if time_str:
-        tm = re.search(r'(?i)(\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*(?:–|-|to)\s*(\d{1,2}(?::\d{2})?\s*(?:am|pm))', time_str)
+        tm = _GZ_TIME_RANGE_RE.search(time_str)
         if tm:
             def to_hm(t):
-                m = re.match(r'(?i)^\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s*$', t)
+                m = _GZ_TIME_AMPM_RE.match(t)
                 hh = int(m.group(1)); mm = int(m.group(2) or 0); ap = m.group(3).lower()
                 if ap == "pm" and hh != 12: hh += 12
                 if ap == "am" and hh == 12: hh = 0
@@ -283,7 +323,7 @@ def _parse_gz_labeled(detail_html: str) -> Optional[Dict[str, Any]]:
             start = start.replace(hour=h1, minute=m1)
             end = datetime(int(y), M, int(d), h2, m2)
         else:
-            tm2 = re.search(r'(?i)(\d{1,2})(?::(\d{2}))?\s*(am|pm)', time_str)
+            tm2 = _GZ_TIME_RE.search(time_str)
             if tm2:
                 hh=int(tm2.group(1)); mm=int(tm2.group(2) or 0); ap=tm2.group(3).lower()
                 if ap=="pm" and hh!=12: hh+=12
@@ -299,9 +339,9 @@ def _parse_gz_labeled(detail_html: str) -> Optional[Dict[str, Any]]:
     }
 
 def _detail_to_event(detail_html: str, page_url: str, source_name: str) -> Optional[Dict[str, Any]]:
-    blocks = _jsonld_events(detail_html)
-    if blocks:
-        ev = blocks[0]
+    # Only the first Event is used, so stop scanning blocks once one turns up.
+    ev = next(_iter_jsonld_events(detail_html), None)
+    if ev is not None:
         title = ev.get("name") or ev.get("headline") or _page_h1(detail_html) or "(untitled)"
         start = ev.get("startDate"); end = ev.get("endDate")
         loc = ev.get("location")
@@ -317,7 +357,7 @@ def _detail_to_event(detail_html: str, page_url: str, source_name: str) -> Optio
             "jsonld": ev, "source": source_name, "_source": "growthzone_html",
         }
     # St. Germain WP pages
-    if re.search(r"^https?://(?:www\.)?st-germain\.com/(?:event|events)/", page_url, re.I):
+    if _STG_EVENT_URL_RE.search(page_url):
         return _parse_stgermain_detail(detail_html, page_url, source_name)
 
     # GrowthZone labeled fallback (Date:/Time:/Location:)
@@ -335,6 +375,30 @@ def _detail_to_event(detail_html: str, page_url: str, source_name: str) -> Optio
     # Minimal
     return {"url": page_url, "source": source_name, "_source": "growthzone_html"}
 
+# Detail-page validators and the events parsed from them; bump version
+# whenever _fetch_detail's parse changes what it returns.
+_DETAIL_CACHE = ValidatorCache("growthzone", version=1)
+
+def _fetch_detail(href: str, session, name: str, logger,
+                  cache: Optional[ValidatorCache] = None) -> Optional[Dict[str, Any]]:
+    def parse(r) -> Dict[str, Any]:
+        ev = _detail_to_event(r.text, href, name)
+        if not ev: return {}
+        if ev.get("start") and "start_utc" not in ev:
+            ev["start_utc"] = ev["start"]
+        if ev.get("end") and "end_utc" not in ev:
+            ev["end_utc"] = ev["end"]
+        return ev if (ev.get("start") or ev.get("start_utc")) else {}
+
+    try:
+        _log(logger, f"[growthzone_html] detail GET {href}")
+        # {} means the page had no dated event; a 304 replays last run's parse
+        ev = get_parsed(session, href, cache, parse, default={})
+        return dict(ev, source=name) if ev else None
+    except Exception as e:
+        _warn(logger, f"[growthzone_html] error parsing {href}: {e}")
+    return None
+
 def _filter_range(events: List[Dict[str, Any]], sdt, edt) -> List[Dict[str, Any]]:
     if not sdt or not edt:
         return events
@@ -353,89 +417,89 @@ def _filter_range(events: List[Dict[str, Any]], sdt, edt) -> List[Dict[str, Any]
             out.append(ev)
     return out
 
+# Listing fallbacks fetched concurrently; they all hit one host, so keep it small.
+_FALLBACK_PROBE_BATCH = 2
+
 def fetch_growthzone_html(*args, **kwargs) -> List[Dict[str, Any]]:
     source, session, start_date, end_date, logger = _coerce_signature(args, kwargs)
     base = _src_url(source); name = _src_name(source, "GrowthZone")
     if not base: return []
 
-    own_session = False
     if session is None:
-        import requests
-        session = requests.Session()
-        own_session = True
-
-    try:
-        _log(logger, f"[growthzone_html] GET {base}")
-        resp = session.get(base, timeout=30); resp.raise_for_status()
-        html = resp.text
-
-        links: Set[str] = set()
-        gz_links = _extract_gz_detail_links(html, base)
-        if gz_links: links |= gz_links
-        _log(logger, f"[growthzone_html] initial gz-detail links: {len(gz_links)}")
-
-        host = urlparse(base).netloc.lower()
-
-        if not links and "stgermainwi.chambermaster.com" in host:
-            out_links = _extract_outbound_stgermain(html, base)
-            if out_links: links |= out_links
-            _log(logger, f"[growthzone_html] initial outbound TEC links: {len(out_links)}")
-
-        if not links:
-            root = _events_root_same_host(base)
-            candidates = [
-                base + ("&o=alpha" if "?" in base else "?o=alpha"),
-                f"{root}/calendar",
-                f"{root}/search",
-                f"{root}/searchscroll",
-            ]
-            for iso in _month_starts(6):
-                candidates.append(f"{root}/calendar/{iso}")
-            for alt in candidates:
-                try:
-                    _log(logger, f"[growthzone_html] fallback GET {alt}")
-                    r2 = session.get(alt, timeout=30)
-                    if not r2.ok: continue
-                    cand = _extract_gz_detail_links(r2.text, alt)
-                    if cand:
-                        links |= cand
-                        _log(logger, f"[growthzone_html] fallback gz links: {len(cand)} from {alt}")
-                        break
-                    if "stgermainwi.chambermaster.com" in host:
-                        extra = _extract_outbound_stgermain(r2.text, alt)
-                        if extra:
-                            links |= extra
-                            _log(logger, f"[growthzone_html] fallback outbound TEC links: {len(extra)} from {alt}")
-                            break
-                except Exception as e:
-                    _warn(logger, f"[growthzone_html] fallback error on {alt}: {e}")
-
-        if not links:
-            _log(logger, "[growthzone_html] no links discovered after fallbacks")
-            return []
-
-        events: List[Dict[str, Any]] = []
-        for href in sorted(links):
+        session = shared_session()
+
+    _log(logger, f"[growthzone_html] GET {base}")
+    resp = session.get(base, timeout=DEFAULT_TIMEOUT); resp.raise_for_status()
+    html = resp.text
+
+    links: Set[str] = set()
+    gz_links = _extract_gz_detail_links(html, base)
+    if gz_links: links |= gz_links
+    _log(logger, f"[growthzone_html] initial gz-detail links: {len(gz_links)}")
+
+    host = urlparse(base).netloc.lower()
+
+    if not links and "stgermainwi.chambermaster.com" in host:
+        out_links = _extract_outbound_stgermain(html, base)
+        if out_links: links |= out_links
+        _log(logger, f"[growthzone_html] initial outbound TEC links: {len(out_links)}")
+
+    if not links:
+        root = _events_root_same_host(base)
+        candidates = [
+            base + ("&o=alpha" if "?" in base else "?o=alpha"),
+            f"{root}/calendar",
+            f"{root}/search",
+            f"{root}/searchscroll",
+        ]
+        for iso in _month_starts(6):
+            candidates.append(f"{root}/calendar/{iso}")
+
+        def _fetch_alt(alt: str) -> Optional[str]:
             try:
-                _log(logger, f"[growthzone_html] detail GET {href}")
-                r = session.get(href, timeout=30)
-                if not r.ok: continue
-                ev = _detail_to_event(r.text, href, name)
-                if not ev: continue
-                if ev.get("start") and "start_utc" not in ev:
-                    ev["start_utc"] = ev["start"]
-                if ev.get("end") and "end_utc" not in ev:
-                    ev["end_utc"] = ev["end"]
-                if ev.get("start") or ev.get("start_utc"):
-                    events.append(ev)
+                _log(logger, f"[growthzone_html] fallback GET {alt}")
+                r2 = session.get(alt, timeout=DEFAULT_TIMEOUT)
+                return r2.text if r2.ok else None
             except Exception as e:
-                _warn(logger, f"[growthzone_html] error parsing {href}: {e}")
-
-        events = _filter_range(events, start_date, end_date)
-        _log(logger, f"[growthzone_html] parsed events: {len(events)}")
-        return events
-
-    finally:
-        if own_session:
-            try: session.close()
-            except Exception: pass
+                _warn(logger, f"[growthzone_html] fallback error on {alt}: {e}")
+                return None
+
+        # All fallbacks sit on one host and the first in candidate order that
+        # yields links wins, so fetch them a small batch at a time and stop
+        # after the batch that produced links.
+        with ThreadPoolExecutor(max_workers=_FALLBACK_PROBE_BATCH) as ex:
+            for i in range(0, len(candidates), _FALLBACK_PROBE_BATCH):
+                batch = candidates[i:i + _FALLBACK_PROBE_BATCH]
+                for alt, body in zip(batch, ex.map(_fetch_alt, batch)):
+                    if body is None: continue
+                    try:
+                        cand = _extract_gz_detail_links(body, alt)
+                        if cand:
+                            links |= cand
+                            _log(logger, f"[growthzone_html] fallback gz links: {len(cand)} from {alt}")
+                            break
+                        if "stgermainwi.chambermaster.com" in host:
+                            extra = _extract_outbound_stgermain(body, alt)
+                            if extra:
+                                links |= extra
+                                _log(logger, f"[growthzone_html] fallback outbound TEC links: {len(extra)} from {alt}")
+                                break
+                    except Exception as e:
+                        _warn(logger, f"[growthzone_html] fallback error on {alt}: {e}")
+                if links:
+                    break
+
+    if not links:
+        _log(logger, "[growthzone_html] no links discovered after fallbacks")
+        return []
+
+    # Detail pages are independent; fetch them concurrently, keep sorted order.
+    hrefs = sorted(links)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        details = ex.map(lambda href: _fetch_detail(href, session, name, logger, _DETAIL_CACHE), hrefs)
+        events = [ev for ev in details if ev]
+    _DETAIL_CACHE.save()
+
+    events = _filter_range(events, start_date, end_date)
+    _log(logger, f"[growthzone_html] parsed events: {len(events)}")
+    return events
@@ -1,14 +1,11 @@
 from __future__ import annotations
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, Tuple, Dict, Any
 from icalendar import Calendar
 from src.fetch import get
 from src.models import Event
 
 
-def fetch_ics(url: str, start_date, end_date) -> Tuple[List[Event], Dict[str, Any]]:
-    resp = get(url)
-    cal = Calendar.from_ical(resp.content)
-    evs: List[Event] = []
+def _iter_events(cal: Calendar) -> Iterator[Event]:
     for comp in cal.walk("vevent"):
         title = str(comp.get("summary") or "(no title)")
         dtstart = comp.get("dtstart")
@@ -19,12 +16,19 @@ def fetch_ics(url: str, start_date, end_date) -> Tuple[List[Event], Dict[str, An
 
         start = getattr(dtstart, "dt", None)
         end = getattr(dtend, "dt", None)
-        evs.append(Event(
+        yield Event(
             title=title,
             start_utc=start,
             end_utc=end,
             description=desc,
             url=url_e,
             location=loc,
-        ))
-    return evs, {"note": "ics parsed"}
+        )
+
+
+def fetch_ics(url: str, start_date, end_date) -> Tuple[Iterator[Event], Dict[str, Any]]:
+    # Fetch and parse eagerly so network/format errors surface here; the
+    # Event objects themselves are produced lazily as the caller consumes them.
+    resp = get(url)
+    cal = Calendar.from_ical(resp.content)
+    return _iter_events(cal), {"note": "ics parsed"}
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from html import unescape
 from typing import List, Optional
 from urllib.parse import urljoin
@@ -11,6 +13,9 @@ import requests
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
 
+from src.fetch import ValidatorCache, get_parsed, shared_session
+from src.util import HTML_PARSER, JSONLD_SCRIPT_RE, json_loads, jsonld_may_have_event, stable_uid
+
 _UA = {
     "User-Agent": "Mozilla/5.0 (compatible; northwoods-events/2.0; +https://github.com/dsundt/northwoods-events-v2)"
 }
@@ -24,16 +29,35 @@ _DATE_RE_RANGE = re.compile(
 _DATE_RE_SINGLE = re.compile(r"([A-Za-z]{3,9}\s+\d{1,2},\s*\d{4})")
 _DATE_ISO = re.compile(r"(\d{4}-\d{2}-\d{2})")
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_LOCATION_RE = re.compile(r"\bLocation\s*:?\s*(.+?)\s*(?:\||$)", re.I)
+_LOCATION_PREFIX_RE = re.compile(r"^\s*Location\s*:?\s*", re.I)
+_AT_VENUE_RE = re.compile(r"\bat\s+([A-Z][\w &'\-\.]+)")
+_TRAILING_Z_RE = re.compile(r"Z$")
+
 def _clean(s: Optional[str]) -> Optional[str]:
     if not s:
         return None
     s = unescape(s)
-    s = re.sub(r"<[^>]+>", " ", s)  # strip tags if present
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _TAG_RE.sub(" ", s)  # strip tags if present
+    s = _WS_RE.sub(" ", s).strip()
     return s or None
 
+_STD_DATE_FMTS = ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d")
+# likely format -> that format first, then the rest as a fallback
+_STD_DATE_ORDER = {f: (f,) + tuple(o for o in _STD_DATE_FMTS if o != f) for f in _STD_DATE_FMTS}
+
+def _std_date_fmt(s: str) -> str:
+    # Pick the likely format from the shape of the text so the common case
+    # needs one strptime instead of a chain of failed attempts.
+    if s[:1].isdigit():
+        return "%Y-%m-%d"
+    return "%b %d, %Y" if len(s.split(" ", 1)[0]) <= 3 else "%B %d, %Y"
+
+@lru_cache(maxsize=1024)
 def _to_std_date(s: str) -> Optional[str]:
-    for fmt in ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"):
+    for fmt in _STD_DATE_ORDER[_std_date_fmt(s)]:
         try:
             dt = datetime.strptime(s, fmt)
             return dt.strftime("%Y-%m-%d 00:00:00")
@@ -59,24 +83,35 @@ def _extract_dates(txt: str) -> (Optional[str], Optional[str]):
     return None, None
 
 def _extract_location(txt: str) -> Optional[str]:
-    m = re.search(r"\bLocation\s*:?\s*(.+?)\s*(?:\||$)", txt, flags=re.I)
+    m = _LOCATION_RE.search(txt)
     if m:
-        return re.sub(r"^\s*Location\s*:?\s*", "", m.group(1), flags=re.I).strip()
+        return _LOCATION_PREFIX_RE.sub("", m.group(1)).strip()
     # Try a “ at Venue ” pattern
-    m = re.search(r"\bat\s+([A-Z][\w &'\-\.]+)", txt)
+    m = _AT_VENUE_RE.search(txt)
     return m.group(1).strip() if m else None
 
-def _fetch_detail_for_dates(url: str, sess: requests.Session, timeout: int = 20) -> (Optional[str], Optional[str], Optional[str]):
+# Detail-page validators and the dates parsed from them; bump version whenever
+# _dates_from_detail_html changes what it returns.
+_DETAIL_CACHE = ValidatorCache("simpleview", version=1)
+
+def _fetch_detail_for_dates(url: str, sess: requests.Session, timeout: int = 20,
+                            cache: Optional[ValidatorCache] = None) -> (Optional[str], Optional[str], Optional[str]):
     """When RSS description has no dates, pull the detail page and parse JSON-LD."""
     try:
-        r = sess.get(url, timeout=timeout)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        # JSON-LD
-        for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        found = get_parsed(sess, url, cache, lambda r: list(_dates_from_detail_html(r.text)),
+                           default=[None, None, None], timeout=timeout, headers=_UA)
+        return tuple(found)
+    except Exception:
+        return None, None, None
+
+def _dates_from_detail_html(html: str) -> (Optional[str], Optional[str], Optional[str]):
+    try:
+        # JSON-LD (raw scan; no tree needed)
+        for m in JSONLD_SCRIPT_RE.finditer(html):
+            if not jsonld_may_have_event(m.group(1)):
+                continue
             try:
-                import json
-                data = json.loads(tag.string or tag.text or "{}")
+                data = json_loads(m.group(1).strip() or "{}")
             except Exception:
                 continue
             items = data if isinstance(data, list) else [data]
@@ -92,7 +127,12 @@ def _fetch_detail_for_dates(url: str, sess: requests.Session, timeout: int = 20)
                         if not x or not isinstance(x, str):
                             return None
                         x = x.strip()
-                        x = re.sub(r"Z$", "+0000", x)  # minimal TZ normalize
+                        # JSON-LD dates are ISO 8601 nearly always
+                        try:
+                            return datetime.fromisoformat(x).strftime("%Y-%m-%d %H:%M:%S")
+                        except ValueError:
+                            pass
+                        x = _TRAILING_Z_RE.sub("+0000", x)  # minimal TZ normalize
                         # Try the common formats
                         for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
                             try:
@@ -106,6 +146,7 @@ def _fetch_detail_for_dates(url: str, sess: requests.Session, timeout: int = 20)
                         return None
                     return norm(start), norm(end), _clean(loc)
         # Otherwise, scrape text
+        soup = BeautifulSoup(html, HTML_PARSER)
         text = _clean(soup.get_text(" ")) or ""
         s, e = _extract_dates(text)
         return s, e, _extract_location(text)
@@ -119,10 +160,9 @@ def fetch_simpleview_html(url: str, timeout: int = 20, max_items: int = 200) ->
       - If description doesn't include a date, try the detail page once.
       - If still undated OR clearly recurring, **skip** (per your instruction).
     """
-    sess = requests.Session()
-    sess.headers.update(_UA)
+    sess = shared_session()
 
-    r = sess.get(url, timeout=timeout)
+    r = sess.get(url, timeout=timeout, headers=_UA)
     r.raise_for_status()
 
     # Parse RSS with stdlib XML (no feedparser dependency)
@@ -132,27 +172,35 @@ def fetch_simpleview_html(url: str, timeout: int = 20, max_items: int = 200) ->
         # Some feeds return HTML if blocked; fallback: no events
         return []
 
-    ns = {}
     channel = root.find("channel") or root
     items = channel.findall("item")
-    events: List[dict] = []
 
+    # First pass: dates from the RSS description alone.
+    rows = []
     for it in items[:max_items]:
         title = _clean((it.findtext("title") or ""))
         link = (it.findtext("link") or "").strip()
         desc = _clean(it.findtext("description") or "")
 
-        # First pass: pull dates from description
         start, end = _extract_dates(desc or "")
 
         # If looks recurring and no concrete date -> skip
         if not start and desc and _RECURRING_HINTS.search(desc):
             continue
 
-        # Try detail page once if still no date
         location = _extract_location(desc or "") or None
-        if not start and link:
-            s2, e2, loc2 = _fetch_detail_for_dates(link, sess, timeout=timeout)
+        rows.append((title, link, start, end, location))
+
+    # Undated items get one detail-page look; fetch those concurrently.
+    need = [link for _, link, start, _, _ in rows if not start and link]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        found = dict(zip(need, ex.map(
+            lambda link: _fetch_detail_for_dates(link, sess, timeout=timeout, cache=_DETAIL_CACHE), need)))
+
+    events: List[dict] = []
+    for title, link, start, end, location in rows:
+        if not start and link in found:
+            s2, e2, loc2 = found[link]
             start = start or s2
             end = end or e2
             location = location or loc2
@@ -161,7 +209,7 @@ def fetch_simpleview_html(url: str, timeout: int = 20, max_items: int = 200) ->
         if not start:
             continue
 
-        uid = f"sv-{abs(hash((link or title or '', start or '')))}"
+        uid = stable_uid("sv-", link or title, start, digest_size=16)
         events.append({
             "uid": uid,
             "title": title or "(untitled event)",
@@ -171,4 +219,5 @@ def fetch_simpleview_html(url: str, timeout: int = 20, max_items: int = 200) ->
             "location": location,
         })
 
+    _DETAIL_CACHE.save()
     return events
@@ -2,19 +2,31 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from html import unescape
+from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
+from src.fetch import DEFAULT_TIMEOUT, ValidatorCache, get_parsed, shared_session
+from src.util import canonical_link, strip_markup
+
 def _clean_text(s: str) -> str:
-    from html import unescape
-    s = re.sub(r"(?is)<script[^>]*>.*?</script>|<style[^>]*>.*?</style>", "", s)
-    s = re.sub(r"(?is)<br\s*/?>|</p>", "\n", s)
-    s = re.sub(r"(?is)<[^>]+>", "", s)
-    return unescape(s).strip()
+    return unescape(strip_markup(s)).strip()
+
+_H1_RE = re.compile(r"(?is)<h1[^>]*>(.*?)</h1>")
+_DATE_RANGE_RE = re.compile(r'(?i)\b([A-Z][a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*(?:–|-|to|&)\s*(\d{1,2}).*?,\s*(\d{4})')
+_DATE_SINGLE_RE = re.compile(r'(?i)\b([A-Z][a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,\s*(\d{4})')
+_EVENT_INFO_RE = re.compile(r'(?is)(<h2[^>]*>\s*Event\s*Info\s*</h2>.*?)(?:<h2|\Z)')
+_LOCATION_SPAN_RE = re.compile(r'(?is)<span[^>]*class="[^"]*x-text-content-text-primary[^"]*"[^>]*>(.*?)</span>')
+_EVENT_HREF_RE = re.compile(r'href=["\'](https?://(?:www\.)?st-germain\.com/(?:event|events)/[^"\']+)["\']', re.I)
+
+# Detail-page validators and _detail_fields output; bump version whenever
+# _detail_fields changes what it returns.
+_DETAIL_CACHE = ValidatorCache("stgermain", version=1)
 
 def _page_h1(html: str) -> Optional[str]:
-    m = re.search(r"(?is)<h1[^>]*>(.*?)</h1>", html)
+    m = _H1_RE.search(html)
     return _clean_text(m.group(1)) if m else None
 
 MONTHS = {m: i for i, m in enumerate(
@@ -23,7 +35,7 @@ MONTHS = {m: i for i, m in enumerate(
 def _parse_date_time(text: str) -> tuple[Optional[str], Optional[str]]:
     t = _clean_text(text)
     # ranges like: October 4 – 6, 2025
-    m = re.search(r'(?i)\b([A-Z][a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*(?:–|-|to|&)\s*(\d{1,2}).*?,\s*(\d{4})', t)
+    m = _DATE_RANGE_RE.search(t)
     if m:
         mon, d1, d2, y = m.groups()
         M = MONTHS.get(mon)
@@ -32,7 +44,7 @@ def _parse_date_time(text: str) -> tuple[Optional[str], Optional[str]]:
             e = datetime(int(y), M, int(d2)).isoformat()
             return s, e
     # single: September 20, 2025
-    m = re.search(r'(?i)\b([A-Z][a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,\s*(\d{4})', t)
+    m = _DATE_SINGLE_RE.search(t)
     if m:
         mon, d, y = m.groups()
         M = MONTHS.get(mon)
@@ -41,74 +53,83 @@ def _parse_date_time(text: str) -> tuple[Optional[str], Optional[str]]:
             return s, None
     return None, None
 
+def _detail_fields(html: str, href: str) -> Dict[str, str]:
+    title = _page_h1(html) or "(untitled)"
+    # Prefer Event Info section if present
+    sect = _EVENT_INFO_RE.search(html)
+    blob = sect.group(1) if sect else html
+    start_iso, end_iso = _parse_date_time(blob)
+    if not start_iso:
+        start_iso, end_iso = _parse_date_time(html)
+    if not start_iso:
+        return {}
+    # Location span you identified
+    loc_m = _LOCATION_SPAN_RE.search(html)
+    loc = _clean_text(loc_m.group(1)) if loc_m else None
+    return {
+        "title": title,
+        "start": start_iso, "end": end_iso,
+        "start_utc": start_iso, "end_utc": end_iso,
+        "location": loc,
+        "url": href,
+    }
+
+def _parse_detail(href: str, session, name: str,
+                  cache: Optional[ValidatorCache] = None) -> Optional[Dict[str, str]]:
+    try:
+        # {} means the page had no date; a 304 replays last run's fields
+        ev = get_parsed(session, href, cache, lambda r: _detail_fields(r.text, href), default={})
+    except Exception:
+        return None
+    return dict(ev, source=name, _source="stgermain_wp") if ev else None
+
 def fetch_stgermain_wp(source, session=None, start_date=None, end_date=None, logger=None) -> List[Dict[str, str]]:
     base = source.get("url") or "https://st-germain.com/events/"
     name = source.get("name") or "St. Germain Chamber (WP)"
-    own_session = False
     if session is None:
-        import requests
-        session = requests.Session()
-        own_session = True
-    try:
-        archive_pages = [base] + [urljoin(base, f"page/{i}/") for i in range(2, 6)]
-        links: Set[str] = set()
-        for url in archive_pages:
-            try:
-                r = session.get(url, timeout=30)
-                if not r.ok:
-                    continue
-                for m in re.finditer(r'href=["\'](https?://(?:www\.)?st-germain\.com/(?:event|events)/[^"\']+)["\']', r.text, flags=re.I):
-                    links.add(m.group(1))
-            except Exception:
+        session = shared_session()
+    archive_pages = [base] + [urljoin(base, f"page/{i}/") for i in range(2, 6)]
+
+    def _fetch_archive(url: str) -> Optional[str]:
+        try:
+            r = session.get(url, timeout=DEFAULT_TIMEOUT)
+            return r.text if r.ok else None
+        except Exception:
+            return None
+
+    # One pool for both stages: archive pages go in first, and each page's
+    # detail fetches are queued as soon as that page is read, so they overlap
+    # with the archive pages still in flight. Results keep archive/link order.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        archives = [ex.submit(_fetch_archive, url) for url in archive_pages]
+        details: Dict[str, Future] = {}  # insertion-ordered dedup
+        for fut in archives:
+            body = fut.result()
+            if not body:
                 continue
+            for m in _EVENT_HREF_RE.finditer(body):
+                href = canonical_link(m.group(1))
+                if href not in details:
+                    details[href] = ex.submit(_parse_detail, href, session, name, _DETAIL_CACHE)
+        parsed = [fut.result() for fut in details.values()]
+    _DETAIL_CACHE.save()
 
-        out: List[Dict[str, str]] = []
-        for href in sorted(links):
+    out: List[Dict[str, str]] = []
+    for ev in parsed:
+        if not ev:
+            continue
+        # Window filter (naive)
+        if start_date and end_date:
             try:
-                r = session.get(href, timeout=30)
-                if not r.ok:
-                    continue
-                html = r.text
-                title = _page_h1(html) or "(untitled)"
-                # Prefer Event Info section if present
-                sect = re.search(r'(?is)(<h2[^>]*>\s*Event\s*Info\s*</h2>.*?)(?:<h2|\Z)', html)
-                blob = sect.group(1) if sect else html
-                start_iso, end_iso = _parse_date_time(blob)
-                if not start_iso:
-                    start_iso, end_iso = _parse_date_time(html)
-                if not start_iso:
-                    continue
-                # Location span you identified
-                loc_m = re.search(r'(?is)<span[^>]*class="[^"]*x-text-content-text-primary[^"]*"[^>]*>(.*?)</span>', html)
-                loc = _clean_text(loc_m.group(1)) if loc_m else None
-
-                ev = {
-                    "title": title,
-                    "start": start_iso, "end": end_iso,
-                    "start_utc": start_iso, "end_utc": end_iso,
-                    "location": loc,
-                    "url": href,
-                    "source": name,
-                    "_source": "stgermain_wp",
-                }
-                # Window filter (naive)
-                if start_date and end_date:
-                    try:
-                        dt = datetime.fromisoformat(start_iso.split("+")[0])
-                        if start_date <= dt <= end_date:
-                            out.append(ev)
-                    except Exception:
-                        out.append(ev)
-                else:
+                dt = datetime.fromisoformat(ev["start"].split("+")[0])
+                if start_date <= dt <= end_date:
                     out.append(ev)
             except Exception:
-                continue
+                out.append(ev)
+        else:
+            out.append(ev)
 
-        if logger:
-            try: logger.debug(f"[stgermain_wp] parsed events: {len(out)}")
-            except Exception: pass
-        return out
-    finally:
-        if own_session:
-            try: session.close()
-            except Exception: pass
+    if logger:
+        try: logger.debug(f"[stgermain_wp] parsed events: {len(out)}")
+        except Exception: pass
+    return out
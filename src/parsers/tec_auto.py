@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Tuple
 from bs4 import BeautifulSoup
-from dateutil import parser as dtp
 from urllib.parse import urlencode
 
 from src.fetch import get
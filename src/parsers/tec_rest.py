@@ -1,10 +1,10 @@
 # src/parsers/tec_rest.py
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse, urlencode
 from datetime import datetime, timedelta
-from dateutil import parser as dtp
-
 from src.fetch import get
+from src.util import json_loads, parse_datetime, stable_uid
 
 def _dtstr(dt: Optional[datetime]) -> Optional[str]:
     return dt.strftime("%Y-%m-%d %H:%M:%S") if dt else None
@@ -16,8 +16,8 @@ def _rest_base(site_url: str) -> str:
 
 def _make_window(start_utc: Optional[str], end_utc: Optional[str]) -> (str, str):
     now = datetime.utcnow()
-    start = dtp.parse(start_utc) if start_utc else now
-    end   = dtp.parse(end_utc) if end_utc else (now + timedelta(days=120))
+    start = parse_datetime(start_utc) if start_utc else now
+    end   = parse_datetime(end_utc) if end_utc else (now + timedelta(days=120))
     return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
 
 def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List[Dict[str, Any]]:
@@ -25,10 +25,9 @@ def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List
     start_d, end_d = _make_window(start_utc, end_utc)
 
     per_page = 50
-    page = 1
     events: List[Dict[str, Any]] = []
 
-    while True:
+    def _page(page: int) -> Dict[str, Any]:
         params = {
             "start_date": start_d,
             "end_date": end_d,
@@ -37,8 +36,21 @@ def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List
         }
         # IMPORTANT: src.fetch.get() does not support params=...
         r = get(f"{api}?{urlencode(params)}")
-        data = r.json()
-        objs = data.get("events") or []
+        return json_loads(r.content)
+
+    # Page 1 says how many pages there are; the rest are independent, so
+    # fetch them a few at a time and consume them in page order as before.
+    data = _page(1)
+    pages = [data.get("events") or []]
+    total = data.get("total_pages")
+    if isinstance(total, int) and total > 1 and len(pages[0]) >= per_page:
+        with ThreadPoolExecutor(max_workers=min(8, total - 1)) as ex:
+            pages += [d.get("events") or [] for d in ex.map(_page, range(2, total + 1))]
+    else:
+        while pages[-1] and len(pages[-1]) >= per_page:
+            pages.append(_page(len(pages) + 1).get("events") or [])
+
+    for objs in pages:
         if not objs:
             break
 
@@ -49,11 +61,11 @@ def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List
             end_s   = ev.get("end_date")
 
             try:
-                start_dt = dtp.parse(start_s) if start_s else None
+                start_dt = parse_datetime(start_s) if start_s else None
             except Exception:
                 start_dt = None
             try:
-                end_dt = dtp.parse(end_s) if end_s else None
+                end_dt = parse_datetime(end_s) if end_s else None
             except Exception:
                 end_dt = None
 
@@ -64,7 +76,8 @@ def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List
                 parts = [v.get("venue"), v.get("address"), v.get("city"), v.get("state")]
                 loc = ", ".join([p for p in parts if p]) or None
 
-            uid = str(ev.get("id") or f"tec-{hash((title, start_s or '', url_e or ''))}")
+            # (title, start, url), the order every tec_html extractor uses too.
+            uid = str(ev.get("id") or stable_uid("tec-", title, start_s, url_e))
 
             events.append({
                 "uid": uid,
@@ -77,6 +90,5 @@ def fetch_tec_rest(url: str, start_utc: str = None, end_utc: str = None) -> List
 
         if len(objs) < per_page:
             break
-        page += 1
 
     return events
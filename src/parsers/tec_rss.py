@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import re
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from html.parser import HTMLParser
 from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-from bs4 import BeautifulSoup
-from dateutil import parser as dtparse
-
-from src.fetch import session
+from src.fetch import shared_session
+from src.util import parse_datetime
 
 
 def _local(tag: str) -> str:
@@ -23,11 +24,43 @@ def _local(tag: str) -> str:
     return tag
 
 
+class _TextCollector(HTMLParser):
+    """Collect stripped text nodes, skipping script/style (like get_text)."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            data = data.strip()
+            if data:
+                self.parts.append(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA["):
+            self.handle_data(data[6:])
+
+
 def _clean_text(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    soup = BeautifulSoup(value, "html.parser")
-    text = soup.get_text(" ", strip=True)
+    if "<" not in value and "&" not in value:
+        # Plain text (most titles): nothing to parse.
+        return value.strip() or None
+    collector = _TextCollector()
+    collector.feed(value)
+    collector.close()
+    text = " ".join(collector.parts)
     return text or None
 
 
@@ -45,38 +78,98 @@ def _find_text(item: ET.Element, *names: str) -> Optional[str]:
     return None
 
 
+_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+
+# "September 6, 2025 10:00 am" and friends -- the shape TEC feeds use when
+# date and time are split into separate elements and re-joined here.
+_MONTH_DT_RE = re.compile(
+    r"(?P<mon>[a-z]+)\.?\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(?P<year>\d{4}))?"
+    r"(?:,?\s+(?P<hh>\d{1,2})(?:(?::(?P<mm>\d{2}))\s*(?P<ap1>am|pm)?|\s*(?P<ap2>am|pm)))?",
+    re.IGNORECASE,
+)
+
+
+def _scan_month_dt(value: str) -> Optional[datetime]:
+    """Parse 'Month D[, YYYY][ H:MM [am|pm]]' directly; None if not that shape."""
+    m = _MONTH_DT_RE.fullmatch(value)
+    if not m:
+        return None
+    month = _MONTHS.get(m.group("mon").lower())
+    if not month:
+        return None
+    year = int(m.group("year")) if m.group("year") else datetime.now().year
+    hour = int(m.group("hh") or 0)
+    minute = int(m.group("mm") or 0)
+    ampm = (m.group("ap1") or m.group("ap2") or "").lower()
+    if ampm:
+        if not 1 <= hour <= 12:
+            return None
+        if ampm == "pm" and hour != 12:
+            hour += 12
+        elif ampm == "am" and hour == 12:
+            hour = 0
+    try:
+        return datetime(year, month, int(m.group("day")), hour, minute)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _tz(tz_name: Optional[str]) -> tzinfo:
+    """Resolve a feed/source timezone name once; unknown names fall back to UTC."""
+    if not tz_name:
+        return timezone.utc
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return timezone.utc
+
+
 def _coerce_dt(value: Optional[str], tz_name: Optional[str]) -> Optional[str]:
     if not value:
         return None
     value = value.strip()
     if not value:
         return None
-    try:
-        dt = dtparse.parse(value)
-    except Exception:
-        return None
-    if dt.tzinfo is None:
+    # Feed fields are ISO or "Month D, YYYY h:mm am" nearly always; dateutil
+    # is only reached when neither fast path recognises the value.
+    dt = _scan_month_dt(value)
+    if dt is None:
         try:
-            from zoneinfo import ZoneInfo
-
-            tz = ZoneInfo(tz_name) if tz_name else timezone.utc
+            dt = parse_datetime(value)
         except Exception:
-            tz = timezone.utc
-        dt = dt.replace(tzinfo=tz)
+            return None
+    return _utc_iso(dt, tz_name)
+
+
+def _utc_iso(dt: datetime, tz_name: Optional[str]) -> str:
+    """Naive values are read in the feed/source timezone; emit UTC ISO with Z."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_tz(tz_name))
     dt = dt.astimezone(timezone.utc)
-    iso = dt.isoformat().replace("+00:00", "Z")
-    return iso
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+_WS_RE = re.compile(r"\s+")
+_TIME_SPLIT_RE = re.compile(
+    r"\s*(?:-|–|—|to|until|til|thru|through|&ndash;|&mdash;)\s*",
+    re.IGNORECASE,
+)
+_LOCATION_RE = re.compile(r"Location\s*[:\-]\s*(.+?)(?:\s{2,}|$)", re.IGNORECASE)
+# Last resort for items without date fields: an ISO date/time in the body.
+_BODY_ISO_RE = re.compile(r"(\d{4}-\d{2}-\d{2}(?:[T\s]\d{2}:\d{2}(?::\d{2})?)?)")
 
 
 def _split_time_parts(text: str) -> List[str]:
     if not text:
         return []
-    cleaned = re.sub(r"\s+", " ", text)
-    parts = re.split(
-        r"\s*(?:-|–|—|to|until|til|thru|through|&ndash;|&mdash;)\s*",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _WS_RE.sub(" ", text)
+    parts = _TIME_SPLIT_RE.split(cleaned)
     out: List[str] = []
     for part in parts:
         part = part.strip()
@@ -220,43 +313,44 @@ def _date_time_from_fields(fields: Dict[str, str], tz_name: Optional[str], *cand
 
 def _extract_location(item: ET.Element, description: Optional[str]) -> Optional[str]:
     parts: List[str] = []
+    seen: set[str] = set()
     for key in ("location", "venue", "address", "city", "state", "country"):
         for child in list(item):
             name = _local(child.tag).lower()
             if key == name:
                 text = _clean_text(child.text) or _clean_text(child.attrib.get("content"))
-                if text:
-                    parts.append(text)
+                if not text:
+                    continue
+                # Case-insensitive de-dupe while collecting (keeps first-seen order)
+                lower = text.lower()
+                if lower in seen:
+                    continue
+                seen.add(lower)
+                parts.append(text)
     if parts:
-        seen: set[str] = set()
-        uniq: List[str] = []
-        for part in parts:
-            lower = part.lower()
-            if lower in seen:
-                continue
-            seen.add(lower)
-            uniq.append(part)
-        return ", ".join(uniq)
+        return ", ".join(parts)
 
     if description:
-        match = re.search(r"Location\s*[:\-]\s*(.+?)(?:\s{2,}|$)", description, flags=re.IGNORECASE)
+        match = _LOCATION_RE.search(description)
         if match:
             loc = match.group(1).strip()
-            loc = re.sub(r"\s+", " ", loc)
+            loc = _WS_RE.sub(" ", loc)
             if loc:
                 return loc
     return None
 
 
 def _to_utc(dt_str: str) -> Optional[datetime]:
+    # start_utc comes out of _coerce_dt as "...Z" ISO, so this is normally a
+    # fromisoformat call; dateutil only sees values from elsewhere.
     try:
-        dt = dtparse.parse(dt_str)
+        dt = parse_datetime(dt_str)
     except Exception:
         return None
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
+    if dt.utcoffset():
+        return dt.astimezone(timezone.utc)
     return dt
 
 
@@ -272,7 +366,7 @@ def fetch_tec_rss(source: Dict, start_date: Optional[datetime] = None, end_date:
     tz_name = source.get("timezone") or "UTC"
     calendar_name = source.get("name")
 
-    sess = session()
+    sess = shared_session()
     try:
         resp = sess.get(url, timeout=getattr(sess, "timeout", 30))
         resp.raise_for_status()
@@ -316,22 +410,18 @@ def fetch_tec_rss(source: Dict, start_date: Optional[datetime] = None, end_date:
             "start_date",
             "start",
         )
-        end, _ = _date_time_from_fields(
-            fields,
-            item_tz,
-            "end_utc",
-            "dtend",
-            "enddate",
-            "end_date",
-            "end",
-        )
 
         if not start and description:
             # Attempt to discover an ISO-like timestamp in the body as a fallback
-            match = re.search(r"(\d{4}-\d{2}-\d{2}(?:[T\s]\d{2}:\d{2}(?::\d{2})?)?)", description)
+            match = _BODY_ISO_RE.search(description)
             if match:
-                start = _coerce_dt(match.group(1), item_tz)
-                start_source = match.group(1)
+                raw = match.group(1)
+                try:
+                    # The pattern only admits ISO shapes; out-of-range parts go the slow way.
+                    start = _utc_iso(datetime.fromisoformat(raw), item_tz)
+                except ValueError:
+                    start = _coerce_dt(raw, item_tz)
+                start_source = raw
         if not start:
             source.setdefault("_fetch_meta", {}).setdefault("warnings", []).append(
                 f"tec_rss skipped '{title}' due to missing start time"
@@ -344,6 +434,17 @@ def fetch_tec_rss(source: Dict, start_date: Optional[datetime] = None, end_date:
         if end_date and start_dt and start_dt > end_date:
             continue
 
+        # Only events that survive the window pay for the end-time lookup.
+        end, _ = _date_time_from_fields(
+            fields,
+            item_tz,
+            "end_utc",
+            "dtend",
+            "enddate",
+            "end_date",
+            "end",
+        )
+
         location = fields.get("location") or _extract_location(item, description)
 
         event = {
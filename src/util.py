@@ -1,17 +1,53 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import unicodedata
 from datetime import date, datetime, time, timezone, timedelta
-from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse, parse_qsl, urlencode
 from typing import Any, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from dateutil import parser as dtp
 
+try:  # optional: noticeably faster on large embedded event arrays
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # optional: C tokenizer for BeautifulSoup, much faster than html.parser
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover
+    HTML_PARSER = "html.parser"
+
+@lru_cache(maxsize=256)
+def _origin(base: str) -> str:
+    p = urlsplit(base)
+    return f"{p.scheme}://{p.netloc}" if p.scheme and p.netloc else ""
+
 def absurl(base: str, href: str) -> str:
+    # Listing pages are almost all absolute or root-relative links; those need
+    # no urljoin parse. Anything urljoin would rewrite takes the slow path.
+    if "/." not in href and not href.endswith(("?", "#")):
+        if href.startswith(("http://", "https://")):
+            return href
+        if href.startswith("/") and not href.startswith("//"):
+            origin = _origin(base)
+            if origin:
+                return origin + href
     return urljoin(base, href)
 
+def canonical_link(u: str) -> str:
+    """Drop #fragments and utm_* params so tracking variants fetch once."""
+    p = urlparse(u)
+    if not p.fragment and "utm_" not in p.query:
+        return u
+    q = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=True) if not k.lower().startswith("utm_")]
+    return urlunparse(p._replace(query=urlencode(q), fragment=""))
+
 
 def _normalize_ascii(value: str) -> str:
     """Best-effort ASCII normalization for slug components."""
@@ -19,15 +55,20 @@ def _normalize_ascii(value: str) -> str:
     return normalized.encode("ascii", "ignore").decode("ascii")
 
 
+_SLUG_DROP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[\s_-]+")
+_SLUG_FALLBACK_DROP_RE = re.compile(r"[^\w-]")
+
+
 def slugify(text: str, fallback: str = "item") -> str:
     """Convert arbitrary text into a filesystem- and URL-friendly slug."""
     text = _normalize_ascii((text or "").strip().lower())
     # Replace non-word characters with a hyphen
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
+    text = _SLUG_DROP_RE.sub("", text)
+    text = _SLUG_SEP_RE.sub("-", text)
     text = text.strip("-")
     fallback = _normalize_ascii((fallback or "item").strip().lower() or "item")
-    fallback = re.sub(r"[^\w-]", "", fallback)
+    fallback = _SLUG_FALLBACK_DROP_RE.sub("", fallback)
     fallback = fallback or "item"
     return text or fallback
 
@@ -42,6 +83,61 @@ def json_default(value: Any) -> str:
         return value.isoformat()
     return str(value)
 
+# One alternation instead of a re.sub pass per rule: script/style blocks are
+# dropped, <br> (and </p>, unless the caller opts out) become newlines, every
+# other tag is stripped.
+_MARKUP_RE = re.compile(
+    r"(?is)<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|(?P<br><br\s*/?>)|(?P<p></p\s*>)|<[^>]+>"
+)
+
+def _markup_br(m: re.Match) -> str:
+    return "\n" if m.group("br") else ""
+
+def _markup_br_p(m: re.Match) -> str:
+    return "\n" if m.lastgroup else ""
+
+def strip_markup(s: str, paragraphs: bool = True) -> str:
+    """Drop tags from an HTML fragment, keeping line breaks; entities are left as-is."""
+    if "<" not in s:
+        return s
+    return _MARKUP_RE.sub(_markup_br_p if paragraphs else _markup_br, s)
+
+# "@type": "Event" always carries the quoted word; blocks without it (WebPage,
+# BreadcrumbList, Organization...) can be skipped before any JSON parsing.
+_EVENT_HINT_RE = re.compile(r'"event"', re.IGNORECASE)
+
+def jsonld_may_have_event(raw: str) -> bool:
+    """Cheap pre-check on a raw JSON-LD block before decoding it."""
+    return bool(raw) and _EVENT_HINT_RE.search(raw) is not None
+
+def json_loads(text: Any) -> Any:
+    """json.loads via orjson when available; stdlib covers what orjson rejects (NaN etc.)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+def stable_uid(prefix: str, *parts: Optional[str], digest_size: int = 8) -> str:
+    """
+    prefix + BLAKE2b hex of the parts. Unlike hash(), the same parts give the
+    same UID in every process, so every parser derives event UIDs through here.
+    """
+    key = "\x1f".join(p or "" for p in parts)
+    return prefix + hashlib.blake2b(key.encode("utf-8"), digest_size=digest_size).hexdigest()
+
+def parse_datetime(value: str) -> datetime:
+    """dtp.parse with a fromisoformat fast path; feeds are ISO 8601 nearly always."""
+    try:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return dtp.parse(value)
+
+# Compiled once at import and shared by every parser that scans JSON-LD in
+# raw markup; group 1 is the block body.
+JSONLD_SCRIPT_RE = re.compile(r'(?is)<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>')
+
 def parse_first_jsonld_event(soup: BeautifulSoup, base_url: str) -> Optional[Dict[str, Any]]:
     """Return a dict with normalized fields from the first JSON-LD Event in the page."""
     for tag in soup.find_all("script", type="application/ld+json"):
@@ -89,7 +185,6 @@ def sanitize_event(ev: dict, source_name: str, calendar_name: str) -> Optional[d
     if not title or not start:
         return None
     uid_base = f"{title}|{start}|{source_name}"
-    import hashlib
     uid = hashlib.sha1(uid_base.encode("utf-8")).hexdigest() + "@northwoods-v2"
     return {
         "uid": uid,
@@ -114,6 +209,9 @@ def _ensure_query_param(items: List[Tuple[str, str]], key: str, value: str) -> L
     return new_items
 
 
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+
+
 def expand_tec_ics_urls(
     base_url: str,
     start_date: Optional[datetime] = None,
@@ -187,7 +285,7 @@ def expand_tec_ics_urls(
             candidate = "/"
         if not candidate.startswith("/"):
             candidate = f"/{candidate}"
-        normalized = re.sub(r"/{2,}", "/", candidate)
+        normalized = _MULTI_SLASH_RE.sub("/", candidate)
         if normalized not in path_candidates:
             path_candidates.append(normalized)
 